@@ -54,8 +54,8 @@ def test_save():
     config_path = os.path.join(os.path.expanduser("~"), f".tqsim")
     store_path = os.path.join(config_path, "store")
     data_path = os.path.join(store_path, "1_3")
-    basis_path = os.path.join(data_path, "basis.dat")
-    sigmas_path = os.path.join(data_path, "sigmas.dat")
+    basis_path = os.path.join(data_path, "basis.npy")
+    sigmas_path = os.path.join(data_path, "sigmas.npy")
 
     assert os.path.exists(store_path)
     assert os.path.exists(data_path)
@@ -158,3 +158,24 @@ def test_measure_1():
         circuit.measure()
     except:
         assert False
+
+
+def test_run_1():
+    # Regression test: the braid sequence below leaves one probability
+    # at 1 + O(eps), which multinomial sampling must tolerate.
+    circuit = AnyonicCircuit()
+    circuit.braid(1, 2)
+    circuit.braid(2, 3)
+    circuit.braid(1, 2)
+    circuit.measure()
+    result = circuit.run(shots=1000)
+
+    assert sum(result["counts"].values()) == 1000
+    assert len(result["memory"]) == 1000
+
+
+def test_run_2():
+    circuit = AnyonicCircuit()
+
+    with pytest.raises(Exception):
+        circuit.run()
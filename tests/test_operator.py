@@ -0,0 +1,87 @@
+# This code is part of TQSim.
+#
+# (C) Copyright Constantine Quantum Technologies, 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+from math import isclose
+
+import numpy as np
+
+from tqsim import generate_braiding_operator
+
+SHAPES = [(1, 3), (1, 4), (2, 3)]
+
+
+def spectral_distance(u, w):
+    """Returns the spectral-norm distance between two unitaries, up to a
+    global phase. Each matrix is divided by its determinant's n-th root
+    so that matrices differing only by a global phase are at distance 0.
+    """
+    u = np.asarray(u, dtype=complex)
+    w = np.asarray(w, dtype=complex)
+    n = u.shape[0]
+
+    u = u / np.linalg.det(u) ** (1 / n)
+    w = w / np.linalg.det(w) ** (1 / n)
+
+    return np.linalg.norm(w - u, 2)
+
+
+def test_spectral_distance_global_phase():
+    u = generate_braiding_operator(1, 1, 3)
+    assert isclose(spectral_distance(u, np.exp(0.3j) * u), 0, abs_tol=1e-13)
+
+
+def test_yang_baxter_relations():
+    for nb_qudits, nb_anyons_per_qudit in SHAPES:
+        nb_anyons = nb_qudits * nb_anyons_per_qudit
+        generators = [
+            generate_braiding_operator(index, nb_qudits, nb_anyons_per_qudit)
+            for index in range(1, nb_anyons)
+        ]
+
+        # The relations are symmetric in (i, j), so only i < j is
+        # checked, and each pair product is computed once and reused.
+        # Both sides of every relation are products of the same
+        # unitaries, so the global phases already match and the raw
+        # differences can be judged directly; they are collected and
+        # measured with a single batched SVD instead of one LAPACK call
+        # per pair.
+        diffs = []
+        for i in range(len(generators)):
+            for j in range(i + 1, len(generators)):
+                ab = generators[i] @ generators[j]
+                ba = generators[j] @ generators[i]
+
+                if j == i + 1:
+                    # Yang-Baxter relation for neighbouring generators.
+                    diffs.append(ab @ generators[i] - ba @ generators[j])
+                else:
+                    # Distant generators commute.
+                    diffs.append(ab - ba)
+
+        singular_values = np.linalg.svd(np.stack(diffs), compute_uv=False)
+        assert np.all(singular_values[:, 0] < 1e-13)
+
+
+def test_unitarity():
+    for nb_qudits, nb_anyons_per_qudit in SHAPES:
+        nb_anyons = nb_qudits * nb_anyons_per_qudit
+        identity = None
+        for index in range(1, nb_anyons):
+            generator = generate_braiding_operator(
+                index, nb_qudits, nb_anyons_per_qudit
+            )
+            if identity is None:
+                # Every generator of a circuit shares one dimension, so
+                # the identity is built once per shape.
+                identity = np.eye(generator.shape[0])
+            product = generator @ generator.conj().T
+            assert np.allclose(product, identity, atol=1e-13)
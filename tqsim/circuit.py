@@ -10,17 +10,109 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import json
+import multiprocessing
 import os
-import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from typing import List, Sequence, Tuple
 
 import numpy as np
 
 from .config import STORE_PATH  # For caching the bases and sigmas.
-from .lib.basis_generator import generate_basis
+from .lib.basis_generator import gen_state, generate_basis, generate_basis_array
 from .lib.drawer import Drawer
 from .lib.operator_generator import generate_braiding_operator
 
+# Process-wide caches for the bases and braiding operators, keyed by
+# (nb_qudits, nb_anyons_per_qudit). Loading the stored arrays from disk
+# happens at most once per shape; subsequent circuits share the same arrays.
+_BASIS_CACHE = {}
+_SIGMAS_CACHE = {}
+_SIGMAS_DAG_CACHE = {}
+_SIGMA_BLOCKS_CACHE = {}
+_SIGMA_BLOCKS_DAG_CACHE = {}
+
+# Shared generator for measurement sampling; constructing a Generator on
+# every run() call is measurable overhead for small circuits.
+_RNG = np.random.default_rng()
+
+# Version of the on-disk basis cache layout; bump when the packed array
+# format changes.
+_BASIS_FORMAT_VERSION = 1
+
+
+def _atomic_save(filename: str, array: np.ndarray) -> None:
+    """Saves an array so that the file appears either complete or not at
+    all: an interrupted or concurrent first run can never leave a
+    truncated cache behind for later imports to choke on."""
+    tmp = filename + f".tmp.{os.getpid()}"
+    with open(tmp, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp, filename)
+
+
+def _atomic_dump_json(filename: str, payload: dict) -> None:
+    """JSON counterpart of _atomic_save for the cache sidecars."""
+    tmp = filename + f".tmp.{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump(payload, f)
+    os.replace(tmp, filename)
+
+
+def _block_structure(sigma: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Decomposes a braiding operator into its diagonal blocks.
+
+    A braiding operator only couples basis states within small invariant
+    subspaces, so its matrix splits into many 1x1 and 2x2 blocks. Applying
+    the blocks to the relevant rows of the unitary is much cheaper than a
+    full dense matrix product when the dimension grows.
+
+    Parameters
+    ----------
+    sigma : np.ndarray
+        The braiding operator matrix.
+
+    Returns
+    -------
+    List[Tuple[np.ndarray, np.ndarray]]
+        One (rows, blocks) pair per occurring block size, where rows has
+        shape (nb_blocks, size) and blocks has shape (nb_blocks, size, size).
+    """
+    dim = sigma.shape[0]
+    coupled = sigma != 0
+    coupled = coupled | coupled.T
+
+    # Connected components of the coupling graph.
+    component_of = np.full(dim, -1)
+    components = []
+    for start in range(dim):
+        if component_of[start] >= 0:
+            continue
+        component = [start]
+        component_of[start] = len(components)
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            for neighbor in np.flatnonzero(coupled[current]):
+                if component_of[neighbor] < 0:
+                    component_of[neighbor] = len(components)
+                    component.append(neighbor)
+                    stack.append(neighbor)
+        components.append(sorted(component))
+
+    by_size = {}
+    for component in components:
+        by_size.setdefault(len(component), []).append(component)
+
+    structure = []
+    for size in sorted(by_size):
+        rows = np.array(by_size[size])
+        blocks = np.ascontiguousarray(sigma[rows[:, :, None], rows[:, None, :]])
+        structure.append((rows, blocks))
+    return structure
+
 
 class AnyonicCircuit:
     """This class represents an anyon-based topological quantum circuit.
@@ -75,16 +167,35 @@ class AnyonicCircuit:
         self.__braids_history: List[Tuple[int, int]] = []
         self.__measured: bool = False
 
-        self.__basis, self.__dim = self.__get_basis()
+        self.__basis_array, self.__dim = self.__get_basis()
+        # Dict form of the basis, rebuilt from the packed array only if
+        # the `basis` property is actually read.
+        self.__basis = None
 
         input_state = np.zeros((self.__dim, 1), dtype=np.complex128)
         input_state[0, 0] = 1
         self.__initial_state = input_state
 
         self.__sigmas = self.__get_sigmas()
-        self.__unitary = np.eye(self.__dim)
-
-        self.__drawer = Drawer(nb_qudits, nb_anyons_per_qudit)
+        self.__sigmas_dag = self.__get_sigmas_dag()
+        self.__sigma_blocks = self.__get_sigma_blocks()
+        self.__sigma_blocks_dag = self.__get_sigma_blocks_dag()
+
+        # The running unitary and a scratch buffer of the same shape. Each
+        # braid writes sigma @ unitary into the buffer and swaps the two
+        # references, so no per-braid allocation takes place.
+        self.__unitary = np.eye(self.__dim, dtype=np.complex128)
+        self.__unitary_buf = np.empty_like(self.__unitary)
+
+        # Output buffer for statevector(), allocated lazily because its
+        # width follows the number of initial-state columns.
+        self.__state_buf = None
+
+        # The drawer is only needed when the circuit is actually drawn, and
+        # it can be rebuilt at any time from the braiding history. It is
+        # therefore constructed lazily in the `drawer` property, so that
+        # pure simulation workloads never pay for worldline bookkeeping.
+        self.__drawer = None
 
     @property
     def nb_qudits(self):
@@ -112,11 +223,21 @@ class AnyonicCircuit:
     def drawer(self):
         """Returns the drawer object for the circuit.
 
+        The drawer is built lazily by replaying the braiding history, so
+        that simulation-only workloads never construct it.
+
         Returns
         -------
         Drawer
             The circuit's drawer object.
         """
+        if self.__drawer is None:
+            drawer = Drawer(self.__nb_qudits, self.__nb_anyons_per_qudit)
+            for (n, m) in self.__braids_history:
+                drawer.braid(m, n)
+            if self.__measured:
+                drawer.measure()
+            self.__drawer = drawer
         return self.__drawer
 
     @property
@@ -140,6 +261,12 @@ class AnyonicCircuit:
             List of all the basis states.
 
         """
+        if self.__basis is None:
+            qudit_len = self.__nb_anyons_per_qudit - 1
+            self.__basis = [
+                gen_state([int(label) for label in row], self.__nb_qudits, qudit_len)
+                for row in self.__basis_array
+            ]
         return self.__basis
 
     @property
@@ -155,52 +282,160 @@ class AnyonicCircuit:
         return self.__sigmas
 
     def __get_basis(self) -> Tuple[np.ndarray, int]:
+        key = (self.__nb_qudits, self.__nb_anyons_per_qudit)
+        if key in _BASIS_CACHE:
+            basis = _BASIS_CACHE[key]
+            return basis, len(basis)
+
         folder_path = os.path.join(
             STORE_PATH, f"{self.__nb_qudits}_{self.__nb_anyons_per_qudit}"
         )
-        filename = os.path.join(folder_path, "basis.dat")
+        filename = os.path.join(folder_path, "basis.npy")
+        meta_filename = os.path.join(folder_path, "basis.json")
         try:
-            with open(filename, "rb") as f:
-                basis = pickle.load(f)
+            # The JSON sidecar records the cache format so that stale
+            # files from older versions are regenerated, not misread.
+            with open(meta_filename) as f:
+                meta = json.load(f)
+            if meta.get("version") != _BASIS_FORMAT_VERSION:
+                raise FileNotFoundError(meta_filename)
+            basis = np.load(filename, mmap_mode="r")
         except FileNotFoundError:
-            basis = generate_basis(self.__nb_qudits, self.__nb_anyons_per_qudit)
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-            with open(filename, "wb") as f:
-                pickle.dump(basis, f)
-
+            basis = generate_basis_array(self.__nb_qudits, self.__nb_anyons_per_qudit)
+            os.makedirs(folder_path, exist_ok=True)
+            _atomic_save(filename, basis)
+            meta = {
+                "version": _BASIS_FORMAT_VERSION,
+                "nb_qudits": self.__nb_qudits,
+                "nb_anyons_per_qudit": self.__nb_anyons_per_qudit,
+                "dim": int(basis.shape[0]),
+            }
+            _atomic_dump_json(meta_filename, meta)
+
+        _BASIS_CACHE[key] = basis
         return basis, len(basis)
 
     def __get_sigmas(self) -> List[np.ndarray]:
+        key = (self.__nb_qudits, self.__nb_anyons_per_qudit)
+        if key in _SIGMAS_CACHE:
+            return _SIGMAS_CACHE[key]
 
         folder_path = os.path.join(
             STORE_PATH, f"{self.__nb_qudits}_{self.__nb_anyons_per_qudit}"
         )
-        filename = os.path.join(folder_path, "sigmas.dat")
+        filename = os.path.join(folder_path, "sigmas.npy")
         try:
-            with open(filename, "rb") as f:
-                sigmas = pickle.load(f)
+            # All operators share one (dim, dim) shape, so they are stored
+            # stacked in a single .npy and memory-mapped read-only: repeat
+            # loads share pages instead of re-reading the file.
+            stacked = np.load(filename, mmap_mode="r")
         except FileNotFoundError:
-            sigmas = []
-            for index in range(1, self.__nb_anyons):
-                sigma = generate_braiding_operator(
-                    index, self.__nb_qudits, self.__nb_anyons_per_qudit
-                )
-                sigmas.append(np.array(sigma))
-
+            indices = range(1, self.__nb_anyons)
+            # The operators are independent of each other, so a cold start
+            # on a large shape fans the generation out across processes.
+            # Small shapes stay serial: pool startup would dominate there.
+            # The parallel path is restricted to the fork start method:
+            # under spawn (the default on Windows and macOS) the workers
+            # re-import the caller's script, which crashes constructions
+            # done at module level. Pool failures fall back to the serial
+            # loop for the same reason — a cold start must never raise.
+            operators = None
+            if (
+                self.__dim >= 64
+                and len(indices) > 1
+                and multiprocessing.get_start_method() == "fork"
+            ):
+                try:
+                    with ProcessPoolExecutor() as executor:
+                        operators = list(
+                            executor.map(
+                                generate_braiding_operator,
+                                indices,
+                                repeat(self.__nb_qudits),
+                                repeat(self.__nb_anyons_per_qudit),
+                            )
+                        )
+                except (BrokenProcessPool, OSError, RuntimeError):
+                    operators = None
+            if operators is None:
+                operators = [
+                    generate_braiding_operator(
+                        index, self.__nb_qudits, self.__nb_anyons_per_qudit
+                    )
+                    for index in indices
+                ]
+            stacked = np.stack(operators)
             os.makedirs(os.path.dirname(filename), exist_ok=True)
-            with open(filename, "wb") as f:
-                pickle.dump(sigmas, f)
+            _atomic_save(filename, stacked)
 
+        sigmas = [np.ascontiguousarray(sigma, dtype=np.complex128) for sigma in stacked]
+        _SIGMAS_CACHE[key] = sigmas
         return sigmas
 
+    def __get_sigmas_dag(self) -> List[np.ndarray]:
+        key = (self.__nb_qudits, self.__nb_anyons_per_qudit)
+        if key not in _SIGMAS_DAG_CACHE:
+            _SIGMAS_DAG_CACHE[key] = [
+                np.ascontiguousarray(sigma.conj().T) for sigma in self.__sigmas
+            ]
+        return _SIGMAS_DAG_CACHE[key]
+
+    def __get_sigma_blocks(self) -> List[List[Tuple[np.ndarray, np.ndarray]]]:
+        key = (self.__nb_qudits, self.__nb_anyons_per_qudit)
+        if key not in _SIGMA_BLOCKS_CACHE:
+            _SIGMA_BLOCKS_CACHE[key] = [
+                _block_structure(sigma) for sigma in self.__sigmas
+            ]
+        return _SIGMA_BLOCKS_CACHE[key]
+
+    def __get_sigma_blocks_dag(self) -> List[List[Tuple[np.ndarray, np.ndarray]]]:
+        key = (self.__nb_qudits, self.__nb_anyons_per_qudit)
+        if key not in _SIGMA_BLOCKS_DAG_CACHE:
+            _SIGMA_BLOCKS_DAG_CACHE[key] = [
+                [
+                    (rows, np.ascontiguousarray(blocks.conj().transpose(0, 2, 1)))
+                    for rows, blocks in structure
+                ]
+                for structure in self.__sigma_blocks
+            ]
+        return _SIGMA_BLOCKS_DAG_CACHE[key]
+
+    def __apply_sigma(self, index: int, dagger: bool = False):
+        """Left-multiplies the running unitary by the braiding operator of
+        index 'index' (or its adjoint), block by block."""
+        if dagger:
+            structure = self.__sigma_blocks_dag[index]
+        else:
+            structure = self.__sigma_blocks[index]
+
+        # A single block spanning the whole space degenerates to the dense
+        # product, for which the preallocated buffer is cheaper.
+        if len(structure) == 1 and structure[0][0].shape[1] == self.__dim:
+            operator = self.__sigmas_dag[index] if dagger else self.__sigmas[index]
+            np.matmul(operator, self.__unitary, out=self.__unitary_buf)
+            self.__unitary, self.__unitary_buf = self.__unitary_buf, self.__unitary
+            return
+
+        unitary = self.__unitary
+        for rows, blocks in structure:
+            if rows.shape[1] == 1:
+                unitary[rows[:, 0]] *= blocks[:, 0]
+            else:
+                updated = np.einsum("bij,bjk->bik", blocks, unitary[rows])
+                unitary[rows.reshape(-1)] = updated.reshape(-1, self.__dim)
+
     def initialize(self, input_state: np.ndarray):
         """Initializes the circuit in the state input_state.
 
+        A batch of initial states can be given as a (dim, k) matrix with
+        one normalized state per column; statevector() then evolves all k
+        states with a single matrix product.
+
         Parameters
         ----------
         input_state : np.ndarray
             A normalized quantum state with the same dimensions as the
-            fusion space.
+            fusion space, or a matrix whose columns are such states.
             Example:    for a 1-qudit circuit with 3 anyons, input_state must
                         be a 3 dimensional vector with norm 1.
 
@@ -224,14 +459,20 @@ class AnyonicCircuit:
             )
 
         input_state = np.array(input_state)
-        if not np.size(input_state) == self.__dim:
-            raise ValueError(f"The state has wrong dimension. Should be {self.__dim}")
+        if input_state.ndim <= 1 or 1 in input_state.shape:
+            if not np.size(input_state) == self.__dim:
+                raise ValueError(
+                    f"The state has wrong dimension. Should be {self.__dim}"
+                )
+            input_state = np.reshape(input_state, (self.__dim, 1))
+        elif input_state.shape[0] != self.__dim:
+            raise ValueError(f"The states have wrong dimension. Should be {self.__dim}")
 
-        norm = np.sum(np.real(input_state * input_state.conjugate()))
-        if not np.isclose(norm, 1):
+        norms = np.einsum("ij,ij->j", input_state.conj(), input_state).real
+        if not np.allclose(norms, 1):
             raise ValueError("The input state is not normalized correctly!")
 
-        self.__initial_state = np.reshape(input_state, (self.__dim, 1))
+        self.__initial_state = input_state
 
         return self
 
@@ -281,15 +522,16 @@ class AnyonicCircuit:
             raise Exception("You can only braid adjacent anyons!")
 
         if n < m:
-            self.__unitary = self.__sigmas[n - 1] @ self.__unitary
+            self.__apply_sigma(n - 1)
         else:
-            self.__unitary = self.__sigmas[m - 1].T.conjugate() @ self.__unitary
+            self.__apply_sigma(m - 1, dagger=True)
 
         self.__braids_history.append((n, m))
 
         self.__nb_braids += 1
 
-        self.drawer.braid(m, n)
+        # The cached drawer (if any) no longer reflects the history.
+        self.__drawer = None
 
         return self
 
@@ -315,6 +557,12 @@ class AnyonicCircuit:
         AnyonicCircuit
             A reference to the same circuit.
         """
+        if self.__measured:
+            raise Exception("System already measured! Cannot perform further braiding!")
+
+        # Validating the whole sequence and merging consecutive repeats of
+        # the same operator, so each run is applied as a single power.
+        groups: List[List[int]] = []
         for ind, power in braid:
             if not isinstance(ind, int) or not isinstance(power, int):
                 raise ValueError("Indices and powers must be integers!")
@@ -328,19 +576,32 @@ class AnyonicCircuit:
                     f"sigma_{ind} is not a valid braiding operator! "
                     f"The operators indices must be < {self.__nb_anyons}."
                 )
+            if power == 0:  # identity, do nothing
+                continue
+
+            if groups and groups[-1][0] == ind and groups[-1][1] * power > 0:
+                groups[-1][1] += power
+            else:
+                groups.append([ind, power])
+
+        for ind, power in groups:
             # Computing m and n
-            m = n = 0
             if power > 0:
                 n = ind
                 m = ind + 1
-            elif power < 0:
+            else:
                 m = ind
                 n = ind + 1
-            else:  # if power=0, do nothing (identity)
-                continue
 
-            for _ in range(abs(power)):
-                self.braid(n, m)
+            operator = self.__sigmas[n - 1] if n < m else self.__sigmas_dag[m - 1]
+            self.__unitary = (
+                np.linalg.matrix_power(operator, abs(power)) @ self.__unitary
+            )
+
+            self.__braids_history.extend([(n, m)] * abs(power))
+            self.__nb_braids += abs(power)
+
+        self.__drawer = None
 
         return self
 
@@ -361,7 +622,7 @@ class AnyonicCircuit:
             raise Exception("Cannot carry the measurements twice!")
 
         self.__measured = True
-        self.drawer.measure()
+        self.__drawer = None
         return self
 
     def history(self, output: str = "raw"):
@@ -452,17 +713,28 @@ class AnyonicCircuit:
     def statevector(self) -> np.ndarray:
         """Computes and returns the current state vector of the circuit.
 
+        The returned array is owned by the circuit and is overwritten by
+        the next statevector() call; copy it if it must outlive that.
+
         Returns
         -------
         ndarray
-            The state vector of the circuit.
+            The state vector of the circuit, as a (dim, k) matrix with one
+            column per initial state (k = 1 unless a batch was given to
+            initialize()).
 
         """
-        return self.__unitary @ self.__initial_state
+        shape = (self.__dim, self.__initial_state.shape[1])
+        if self.__state_buf is None or self.__state_buf.shape != shape:
+            self.__state_buf = np.empty(shape, dtype=np.complex128)
+        return np.matmul(self.__unitary, self.__initial_state, out=self.__state_buf)
 
     def unitary(self) -> np.ndarray:
         """Returns the unitary representation of the quantum circuit.
 
+        The returned array is owned by the circuit and is reused by
+        subsequent braiding operations; copy it if it must outlive them.
+
         Returns
         -------
         ndarray
@@ -470,7 +742,7 @@ class AnyonicCircuit:
         """
         return self.__unitary
 
-    def run(self, shots: int = 1000):
+    def run(self, shots: int = 1000, include_memory: bool = True):
         """Simulates the quantum circuit for 'shots' number of times and
         returns the measurement results.
 
@@ -478,6 +750,10 @@ class AnyonicCircuit:
         ----------
         shots : int, optional
             Number of times the circuit is simulated. The default is 1000.
+        include_memory : bool, optional
+            Whether to return the individual shot outcomes under the
+            "memory" key. Counts alone are sampled in O(dim) time,
+            independent of the number of shots. The default is True.
 
         Raises
         ------
@@ -495,13 +771,30 @@ class AnyonicCircuit:
             raise Exception("The system was not measured!")
 
         statevector = self.statevector()
-        probs = np.ravel(np.real(statevector * statevector.conjugate()))
-        memory = np.random.choice(np.arange(self.__dim), p=probs, size=shots)
-
-        idx, counts = np.unique(memory, return_counts=True)
-
-        counts_dict = {}
-        for i in range(len(idx)):
-            counts_dict[str(idx[i])] = counts[i]
-
-        return {"counts": counts_dict, "memory": memory}
+        if statevector.shape[1] != 1:
+            raise Exception(
+                "run() supports a single initial state; "
+                "use statevector() for batched states!"
+            )
+        statevector = np.ravel(statevector)
+        probs = statevector.real**2 + statevector.imag**2
+
+        # Unitary round-off can leave the probabilities summing to
+        # 1 + O(eps), which multinomial rejects; renormalize and clip
+        # before sampling.
+        probs /= probs.sum()
+        probs = np.clip(probs, 0, 1)
+
+        # Multinomial sampling draws the counts for all outcomes at once,
+        # instead of one binary search per shot.
+        counts = _RNG.multinomial(shots, probs)
+        idx = np.nonzero(counts)[0]
+        counts_dict = {str(i): int(counts[i]) for i in idx}
+
+        result = {"counts": counts_dict}
+        if include_memory:
+            memory = np.repeat(idx, counts[idx])
+            _RNG.shuffle(memory)
+            result["memory"] = memory
+
+        return result
@@ -10,13 +10,15 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+from functools import lru_cache
+from itertools import product
 from typing import List
 
 import numpy as np
 
 
 def check_rule(anyon1: int, anyon2: int, outcome: int) -> bool:
-    """ Returns True if 'anyon1 x anyon2 = outcome' obeys the Fibonacci
+    """Returns True if 'anyon1 x anyon2 = outcome' obeys the Fibonacci
     fusion rules, returns False otherwise.
 
     Parameters
@@ -44,14 +46,19 @@ def check_rule(anyon1: int, anyon2: int, outcome: int) -> bool:
         return False
 
 
+# Fusion of successive outcomes with a tau anyon as a 2-state DFA:
+# _NEXT[previous, outcome] is 1 when 'previous x 1 = outcome' is allowed.
+_NEXT = np.array([[0, 1], [1, 1]], dtype=np.int8)
+
+
 def check_outcomes(outcomes: List[int]) -> bool:
     previous_outcome = 1
+    allowed = _NEXT
 
     for outcome in outcomes:
-        if check_rule(previous_outcome, 1, outcome):
-            previous_outcome = outcome
-        else:
+        if not allowed[previous_outcome, outcome]:
             return False
+        previous_outcome = outcome
     return True
 
 
@@ -94,10 +101,64 @@ def gen_state(comb: List[int], nb_qudits: int, qudit_len: int):
     return state
 
 
+def _valid_qudit_sequences(qudit_len: int) -> List[List[int]]:
+    """Returns every qudit label sequence allowed by the fusion rules,
+    ordered by the little-endian value of the sequence (first label is
+    the least significant), matching the historical enumeration order."""
+    sequences = []
+    for value in range(2**qudit_len):
+        outcomes = [(value >> i) & 1 for i in range(qudit_len)]
+        if check_outcomes(outcomes):
+            sequences.append(outcomes)
+    return sequences
+
+
+@lru_cache(maxsize=None)
+def _generate_basis(nb_qudits: int, nb_anyons_per_qudit: int):
+    """Cached form of generate_basis. The returned list is shared by
+    every caller and must never be mutated; the public wrapper hands out
+    copies."""
+    nb_roots = nb_qudits - 1
+    qudit_len = nb_anyons_per_qudit - 1
+
+    qudit_sequences = _valid_qudit_sequences(qudit_len)
+    root_combs = [
+        [(value >> i) & 1 for i in range(nb_roots)] for value in range(2**nb_roots)
+    ]
+
+    basis = []
+
+    # The historical order treats the flattened labels as a little-endian
+    # counter with the roots as the most significant block; product()
+    # varies its last argument fastest, hence the reversed qudit tuple.
+    for roots in root_combs:
+        for combo in product(*[qudit_sequences] * nb_qudits):
+            qudits = combo[::-1]
+
+            previous_outcome = qudits[0][-1]
+            for i, root in enumerate(roots):
+                if not check_rule(previous_outcome, qudits[i + 1][-1], root):
+                    break
+                previous_outcome = root
+            else:
+                basis.append(
+                    {"qudits": [qudit[:] for qudit in qudits], "roots": roots[:]}
+                )
+
+    return basis
+
+
 def generate_basis(nb_qudits: int, nb_anyons_per_qudit: int):
     """Generates all the basis states for a system of a given number of
     qudits, and a given number of anyons per qudit.
 
+    Valid states are constructed directly, qudit by qudit, instead of
+    enumerating and rejecting all 2^nb_labels label combinations: each
+    qudit can only take one of the fusion-rule-respecting sequences, and
+    only the root chain remains to be checked per candidate. The result
+    is cached per shape; callers get a fresh copy so mutating it cannot
+    poison the cache.
+
     Parameters
     ----------
     nb_qudits : int
@@ -110,31 +171,43 @@ def generate_basis(nb_qudits: int, nb_anyons_per_qudit: int):
     basis : List[basis states]
         A list of basis states.
     """
-    nb_roots = nb_qudits - 1
-    qudit_len = nb_anyons_per_qudit - 1
-    nb_labels = nb_qudits * qudit_len + nb_roots
-
-    basis = []
+    return [
+        {
+            "qudits": [qudit[:] for qudit in state["qudits"]],
+            "roots": state["roots"][:],
+        }
+        for state in _generate_basis(nb_qudits, nb_anyons_per_qudit)
+    ]
 
-    curr_comb = [0] * nb_labels
-    final_comb = [1] * nb_labels
 
-    curr_state = gen_state(curr_comb, nb_qudits, qudit_len)
+def generate_basis_array(nb_qudits: int, nb_anyons_per_qudit: int) -> np.ndarray:
+    """Generates the basis as a packed int8 array.
 
-    if check_state(curr_state):
-        basis.append(curr_state)
+    Each row encodes one basis state with the qudit labels flattened in
+    order, followed by the fusion roots. Rows follow the same ordering
+    as generate_basis, and the dict form of row i can be rebuilt with
+    gen_state.
 
-    while not np.all(curr_comb == final_comb):
-        for i, label in enumerate(curr_comb):
-            if label == 0:
-                curr_comb[i] = 1
-                break
-            else:
-                curr_comb[i] = 0
+    Parameters
+    ----------
+    nb_qudits : int
+        Number of qudits in the circuit.
+    nb_anyons_per_qudit : int
+        Number of anyons in each qudit.
 
-        curr_state = gen_state(curr_comb, nb_qudits, qudit_len)
+    Returns
+    -------
+    ndarray
+        An int8 array of shape (dim, nb_qudits * qudit_len + nb_roots).
+    """
+    basis = _generate_basis(nb_qudits, nb_anyons_per_qudit)
+    qudit_len = nb_anyons_per_qudit - 1
+    nb_labels = nb_qudits * qudit_len + nb_qudits - 1
 
-        if check_state(curr_state):
-            basis.append(curr_state)
+    array = np.empty((len(basis), nb_labels), dtype=np.int8)
+    for i, state in enumerate(basis):
+        array[i] = [label for qudit in state["qudits"] for label in qudit] + state[
+            "roots"
+        ]
 
-    return basis
+    return array
@@ -12,7 +12,6 @@
 
 from typing import List, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from .drawer_anyon import DrawerAnyon
@@ -26,25 +25,31 @@ class Drawer:
         nb_anyons_per_qudit: int,
     ):
         self._i = np.linspace(0, 1)
-        self._one = np.ones_like(self._i)
         self._hi = np.linspace(0, 0.46, 25)
         self._id = 2 * (0.5 - self._hi[-1])
 
+        # The sigmoid profiles only depend on the sample points above, so
+        # they are evaluated once here instead of on every braid.
+        self._sig = self._sigmoid(self._i)
+        self._sig_split = self._sigmoid(
+            np.append(self._hi, np.linspace(1 - self._hi[-1], 1, 25))
+        )
+
         self.__nb_qudits = nb_qudits
         self.__nb_anyons_per_qudit = nb_anyons_per_qudit
         self.__nb_anyons = nb_qudits * nb_anyons_per_qudit
 
-        self.__anyons = {}
-        self.__idx_map = {}
-
-        self.__STARTING_INDEX = 1
+        # Anyons are indexed 0-based; __idx_map[position] gives the index
+        # of the anyon currently at that worldline position, so a braid
+        # only swaps two integers.
+        self.__anyons = []
+        self.__idx_map = list(range(self.__nb_anyons))
 
         for i in range(self.__nb_qudits):
             for j in range(self.__nb_anyons_per_qudit):
-                id = i * self.__nb_anyons_per_qudit + j + self.__STARTING_INDEX
-                self.__idx_map[id] = id
-                self.__anyons[id] = DrawerAnyon(
-                    id, (i * (self.__nb_anyons_per_qudit + 1) + j)
+                id = i * self.__nb_anyons_per_qudit + j
+                self.__anyons.append(
+                    DrawerAnyon(id, (i * (self.__nb_anyons_per_qudit + 1) + j))
                 )
 
     @property
@@ -60,33 +65,28 @@ class Drawer:
     def braid(self, m: int, n: int) -> None:
 
         # Preprocess
-        m_init = self.__idx_map[m]
-        n_init = self.__idx_map[n]
+        m_init = self.__idx_map[m - 1]
+        n_init = self.__idx_map[n - 1]
 
         anyon_over = self.__anyons[m_init]
         anyon_under = self.__anyons[n_init]
-        anyons_idle = map(
-            lambda x: self.__anyons[x],
-            filter(lambda x: x != m_init and x != n_init, self.__anyons.keys()),
-        )
 
         distance = abs(anyon_over.get_last_y() - anyon_under.get_last_y())
 
         # Process the idle anyons
-        for curr_anyon in anyons_idle:
-            curr_anyon.add_identity()
+        for idx, curr_anyon in enumerate(self.__anyons):
+            if idx != m_init and idx != n_init:
+                curr_anyon.add_identity()
 
         # Process the over anyon
         anyon_over.x = anyon_over.get_last_x() + self._i
-        anyon_over.y = anyon_over.get_last_y() - distance * np.sign(
-            m - n
-        ) * self._sigmoid(self._i)
+        anyon_over.y = anyon_over.get_last_y() - distance * np.sign(m - n) * self._sig
 
         # Process the bottom anyon
         anyon_under.x = anyon_under.get_last_x() + self._hi
         anyon_under.x = anyon_under.get_last_x() + self._id + self._hi
 
-        sigm = self._sigmoid(np.append(self._hi, np.linspace(1 - self._hi[-1], 1, 25)))
+        sigm = self._sig_split
 
         start_y = anyon_under.get_last_y()
 
@@ -95,7 +95,10 @@ class Drawer:
         anyon_under.y = start_y + distance * np.sign(m - n) * sigm[25:]
 
         # Renaming
-        self.__idx_map[n], self.__idx_map[m] = self.__idx_map[m], self.__idx_map[n]
+        self.__idx_map[n - 1], self.__idx_map[m - 1] = (
+            self.__idx_map[m - 1],
+            self.__idx_map[n - 1],
+        )
 
     def __fuse(self, idx_anyon_top, idx_anyon_bot):
         self.__anyons[idx_anyon_bot].x = (
@@ -111,60 +114,47 @@ class Drawer:
             - self.__anyons[idx_anyon_top].get_last_y()
         )
 
-        self.__anyons[idx_anyon_bot].y = self.__anyons[
-            idx_anyon_bot
-        ].get_last_y() + distance * self._sigmoid(self._i)
+        self.__anyons[idx_anyon_bot].y = (
+            self.__anyons[idx_anyon_bot].get_last_y() + distance * self._sig
+        )
 
-        self.__anyons[idx_anyon_top].y = self.__anyons[
-            idx_anyon_top
-        ].get_last_y() - distance * self._sigmoid(self._i)
+        self.__anyons[idx_anyon_top].y = (
+            self.__anyons[idx_anyon_top].get_last_y() - distance * self._sig
+        )
 
     def measure(self):
-        for curr_anyon in self.__anyons.values():
+        for curr_anyon in self.__anyons:
             curr_anyon.add_identity()
 
+        # Idle time has a closed form: during the fusion chain of a
+        # qudit, the anyon at slot k waits through the k-1 fuse steps
+        # below it, all before its own first move, so the per-step idle
+        # walks collapse to one add_identities call per anyon.
+        for i in range(self.__nb_qudits):
+            for k in range(2, self.__nb_anyons_per_qudit):
+                idx = self.__idx_map[i * self.__nb_anyons_per_qudit + k]
+                self.__anyons[idx].add_identities(k - 1)
+
         # Fusing anyons within qudits
         for i in range(self.__nb_qudits):
             for j in range(self.__nb_anyons_per_qudit - 1):
-                # Idle anyons
-                for k in range(j + 2, self.__nb_anyons_per_qudit):
-                    final_idx = (
-                        i * self.__nb_anyons_per_qudit + k + self.__STARTING_INDEX
-                    )
-                    idx = self.__idx_map[final_idx]
-                    self.__anyons[idx].add_identity()
-
-                # Fusing
-                final_bot_idx = (
-                    i * self.__nb_anyons_per_qudit + j + self.__STARTING_INDEX
-                )
+                final_bot_idx = i * self.__nb_anyons_per_qudit + j
 
                 idx_anyon_bot = self.__idx_map[final_bot_idx]
                 idx_anyon_top = self.__idx_map[final_bot_idx + 1]
 
                 self.__fuse(idx_anyon_top, idx_anyon_bot)
 
+        # Likewise for the qudit fusion chain: the last anyon of qudit k
+        # waits through k-1 steps before it is fused down.
+        for k in range(2, self.__nb_qudits):
+            idx = self.__idx_map[(k + 1) * self.__nb_anyons_per_qudit - 1]
+            self.__anyons[idx].add_identities(k - 1)
+
         # Fusing qudits
         for i in range(1, self.__nb_qudits):
-            # 1 -> None
-            # 2 -> 1
-            # 3 -> 1, 2
-
-            # Idle qudits
-            for k in range(i + 1, self.__nb_qudits):
-                # 2 -> None
-                # 3 -> 2
-                final_idx = (
-                    (k + 1) * self.__nb_anyons_per_qudit + self.__STARTING_INDEX - 1
-                )
-                idx = self.__idx_map[final_idx]
-                self.__anyons[idx].add_identity()
-
-            # Fusing
-            final_bot_idx = i * self.__nb_anyons_per_qudit + self.__STARTING_INDEX - 1
-            final_top_idx = (
-                (i + 1) * self.__nb_anyons_per_qudit + self.__STARTING_INDEX - 1
-            )
+            final_bot_idx = i * self.__nb_anyons_per_qudit - 1
+            final_top_idx = (i + 1) * self.__nb_anyons_per_qudit - 1
 
             idx_anyon_bot = self.__idx_map[final_bot_idx]
             idx_anyon_top = self.__idx_map[final_top_idx]
@@ -172,23 +162,22 @@ class Drawer:
             self.__fuse(idx_anyon_top, idx_anyon_bot)
 
     def draw(self):
-        width = self.__anyons[1].get_last_x() * 0.5
+        # Imported here so that simulation-only workloads never pay the
+        # matplotlib import cost.
+        import matplotlib.pyplot as plt
+
+        width = self.__anyons[0].get_last_x() * 0.5
         height = self.__nb_anyons * 0.3
         fig, ax = plt.subplots(1, 1, figsize=(width, height))
 
-        for i in range(self.__nb_qudits):
-            for j in range(self.__nb_anyons_per_qudit):
-                k = i * self.__nb_anyons_per_qudit + j + 1
-                curr_anyon = self.__anyons[k]
-
-                for x, y in zip(curr_anyon.x, curr_anyon.y):
-                    ax.plot(x, y, curr_anyon.color)
-                ax.text(
-                    -0.2,
-                    curr_anyon.get_first_y(),
-                    curr_anyon.label,
-                    horizontalalignment="right",
-                )
+        for curr_anyon in self.__anyons:
+            ax.plot(curr_anyon.x, curr_anyon.y, curr_anyon.color)
+            ax.text(
+                -0.2,
+                curr_anyon.get_first_y(),
+                curr_anyon.label,
+                horizontalalignment="right",
+            )
         ax.axis("off")
         if fig:
             matplotlib_close_if_inline(fig)
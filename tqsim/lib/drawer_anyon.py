@@ -12,17 +12,39 @@
 
 import numpy as np
 
+# Sample points shared by every worldline segment. They are identical
+# for all anyons, so they live at module level, read-only.
+_I = np.linspace(0, 1)
+_I.flags.writeable = False
+
 
 class DrawerAnyon:
+
+    __INITIAL_CAPACITY = 256
+
     def __init__(self, initial_id, pos):
-        self.__i = np.linspace(0, 1)
-        self.__one = np.ones_like(self.__i)
-        self.__x = [np.copy(self.__i)]
-        self.__y = [pos * self.__one]
+        # Worldline coordinates, stored as flat growable buffers (capacity
+        # is doubled when exhausted). Every segment starts where the
+        # previous one ended, so the whole worldline is a single polyline
+        # that can be drawn with one plot call.
+        self.__x = np.empty(self.__INITIAL_CAPACITY)
+        self.__y = np.empty(self.__INITIAL_CAPACITY)
+        self.__nx = 0
+        self.__ny = 0
+
+        # Number of identity (horizontal) segments that have been requested
+        # but not yet materialized as coordinates. Identity segments only
+        # shift the worldline along x, so they can be accumulated as a
+        # counter and flushed as a single straight segment when the anyon
+        # moves again or gets drawn.
+        self.__nb_pending_identities = 0
 
         self.__color = "black"
         self.__label = ""
 
+        self.x = _I
+        self.y = np.full(_I.size, float(pos))
+
     def __repr__(self):
         return f"{self.__label} (color: {self.__color}"
 
@@ -47,29 +69,63 @@ class DrawerAnyon:
 
     @property
     def x(self):
-        return self.__x
+        self.__flush_identities()
+        return self.__x[: self.__nx]
 
     @x.setter
     def x(self, new):
-        self.__x.append(new)
+        self.__flush_identities()
+        self.__x, self.__nx = self.__append(self.__x, self.__nx, new)
 
     @property
     def y(self):
-        return self.__y
+        self.__flush_identities()
+        return self.__y[: self.__ny]
 
     @y.setter
     def y(self, new):
-        self.__y.append(new)
+        self.__y, self.__ny = self.__append(self.__y, self.__ny, new)
 
     def get_last_x(self):
-        return self.__x[-1][-1]
+        return self.__x[self.__nx - 1] + self.__nb_pending_identities
 
     def get_first_y(self):
-        return self.__y[0][0]
+        return self.__y[0]
 
     def get_last_y(self):
-        return self.__y[-1][-1]
+        return self.__y[self.__ny - 1]
 
     def add_identity(self):
-        self.__x.append(self.__i + self.get_last_x())
-        self.__y.append(self.__one * self.get_last_y())
+        self.__nb_pending_identities += 1
+
+    def add_identities(self, nb_identities):
+        self.__nb_pending_identities += nb_identities
+
+    @staticmethod
+    def __append(buffer, count, values):
+        values = np.asarray(values)
+        needed = count + values.size
+
+        capacity = buffer.size
+        while capacity < needed:
+            capacity *= 2
+        if capacity != buffer.size:
+            grown = np.empty(capacity)
+            grown[:count] = buffer[:count]
+            buffer = grown
+
+        buffer[count:needed] = values
+        return buffer, needed
+
+    def __flush_identities(self):
+        """Materializes the pending identity segments as a single straight
+        worldline segment."""
+        if self.__nb_pending_identities == 0:
+            return
+
+        last_x = self.__x[self.__nx - 1]
+        last_y = self.__y[self.__ny - 1]
+        pending = self.__nb_pending_identities
+        self.__nb_pending_identities = 0
+        self.x = np.array([last_x, last_x + pending])
+        self.y = np.array([last_y, last_y])
@@ -10,17 +10,16 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-from copy import deepcopy
+from functools import lru_cache
 
 import numpy as np
 
-from .basis_generator import generate_basis
+from .basis_generator import _generate_basis
 
 
-def F(a1, a2, a3, outcome):
-    """
-    F matrix
-    """
+def _gen_f_matrix(a1, a2, a3, outcome):
+    """Computes the F matrix for one tuple of anyon charges. Used once at
+    import time to fill the _F_TABLE lookup table."""
     inv_phi = (np.sqrt(5) - 1) / 2  # inverse of golden number
     f_matrix = np.array([[0, 0], [0, 0]])
 
@@ -52,27 +51,71 @@ def F(a1, a2, a3, outcome):
     return f_matrix
 
 
-def R(a1, a2):
+def _build_f_table():
+    table = np.empty((2, 2, 2, 2, 2, 2), dtype=np.complex128)
+    for index in np.ndindex(2, 2, 2, 2):
+        table[index] = _gen_f_matrix(*index)
+    return table
+
+
+# All F matrices precomputed over the 16 possible charge tuples: the hot
+# loops below index _F_TABLE[a1, a2, a3, outcome] instead of rebuilding a
+# 2x2 array per call. _F_DAG_TABLE holds the conjugate transposes.
+_F_TABLE = _build_f_table()
+_F_DAG_TABLE = np.ascontiguousarray(_F_TABLE.conj().swapaxes(-1, -2))
+_F_TABLE.flags.writeable = False
+_F_DAG_TABLE.flags.writeable = False
+
+
+def F(a1, a2, a3, outcome):
     """
-    R matrix
+    F matrix
     """
-    if a1 + a2 == 2:
-        r_matrix = np.array(
-            [[np.exp(-4 * np.pi * 1j / 5), 0], [0, np.exp(3 * np.pi * 1j / 5)]]
+    return _F_TABLE[a1, a2, a3, outcome]
+
+
+def _build_r_table():
+    table = np.empty((2, 2, 2, 2), dtype=np.complex128)
+    for a1, a2 in np.ndindex(2, 2):
+        if a1 + a2 == 2:
+            table[a1, a2] = np.array(
+                [[np.exp(-4 * np.pi * 1j / 5), 0], [0, np.exp(3 * np.pi * 1j / 5)]]
+            )
+        else:
+            table[a1, a2] = np.array([[1, 0], [0, 1]])
+    return table
+
+
+def _build_b_table():
+    table = np.empty((2, 2, 2, 2, 2, 2), dtype=np.complex128)
+    for a0, a1, a2, outcome in np.ndindex(2, 2, 2, 2):
+        table[a0, a1, a2, outcome] = (
+            _F_TABLE[a0, a1, a2, outcome]
+            @ _R_TABLE[a1, a2]
+            @ _F_DAG_TABLE[a0, a2, a1, outcome]
         )
-    else:
-        r_matrix = np.array([[1, 0], [0, 1]])
+    return table
 
-    return r_matrix
+
+# R and B matrices precomputed over all charge tuples, like _F_TABLE.
+_R_TABLE = _build_r_table()
+_B_TABLE = _build_b_table()
+_R_TABLE.flags.writeable = False
+_B_TABLE.flags.writeable = False
+
+
+def R(a1, a2):
+    """
+    R matrix
+    """
+    return _R_TABLE[a1, a2]
 
 
 def B(a0, a1, a2, outcome):
     """
     Braiding matrix
     """
-    b_matrix = F(a0, a1, a2, outcome) @ R(a1, a2) @ F(a0, a2, a1, outcome).T.conjugate()
-
-    return b_matrix
+    return _B_TABLE[a0, a1, a2, outcome]
 
 
 def sigma(index, state_f, state_i):
@@ -99,7 +142,7 @@ def sigma(index, state_f, state_i):
     outcome = state_i[index - 1]
     a = stt_i[index - 1]
     b = stt_f[index - 1]
-    amplitude = B(a0, 1, 1, outcome)[a, b]
+    amplitude = _B_TABLE[a0, 1, 1, outcome, a, b]
 
     ket = stt_i
     ket[index - 1] = b
@@ -125,53 +168,22 @@ def L(k, h, i_, i, jj_, jj):
         jj_: list: [i'_{(m+1)1},....i'_{(m+1)q}]
         jj: list: [i_{(m+1)1},....i_{(m+1)q}]
     """
-    component = 0 + 0j
-
     qudit_len = len(jj)
-    jjj_ = deepcopy(jj_)
-    jjj = deepcopy(jj)
-    jjj_ = [1] + jjj_
-    jjj = [1] + jjj
-
-    init_p = [0] * qudit_len
-    final_p = [1] * qudit_len
-    new_p = init_p
-    while new_p != final_p:
-        pp = deepcopy(new_p)
-        pp.append(k)
-        product = 1 + 0j
-        for ii in range(qudit_len):
-            product = (
-                product
-                * F(i, jjj[ii], 1, pp[ii + 1]).T.conjugate()[jjj[ii + 1], pp[ii]]
-                * F(i_, jjj_[ii], 1, pp[ii + 1])[pp[ii], jjj_[ii + 1]]
-            )
+    jjj_ = [1] + jj_
+    jjj = [1] + jj
 
-        product = product * B(h, 1, 1, pp[0])[i, i_]
-        component += product
-        # iterate
-        for ii, label in enumerate(new_p):
-            if label == 0:
-                new_p[ii] = 1
-                break
-            else:
-                new_p[ii] = 0
-
-    # final iteration
-    pp = deepcopy(new_p)
-    pp.append(k)
-    product = 1 + 0j
+    # The sum over the 2^qudit_len internal labels p_1...p_q factorizes
+    # into a chain of 2x2 transfer matrices M_ii[p_ii, p_{ii+1}], so the
+    # whole enumeration collapses to qudit_len small matrix products.
+    vec = _B_TABLE[h, 1, 1, :, i, i_]
     for ii in range(qudit_len):
-        product = (
-            product
-            * F(i, jjj[ii], 1, pp[ii + 1]).T.conjugate()[jjj[ii + 1], pp[ii]]
-            * F(i_, jjj_[ii], 1, pp[ii + 1])[pp[ii], jjj_[ii + 1]]
-        )
-
-    product = product * B(h, 1, 1, pp[0])[i, i_]
-    component += product
+        transfer = (
+            _F_DAG_TABLE[i, jjj[ii], 1, :, jjj[ii + 1], :]
+            * _F_TABLE[i_, jjj_[ii], 1, :, :, jjj_[ii + 1]]
+        ).T
+        vec = vec @ transfer
 
-    return component
+    return vec[k]
 
 
 def S(jm, jmo, jmoo, jmo_, h, i_, i, jj_, jj):
@@ -194,14 +206,29 @@ def S(jm, jmo, jmoo, jmo_, h, i_, i, jj_, jj):
 
     for kk in [0, 1]:
         component += (
-            F(jmoo, i, jj[-1], jm)[jmo, kk]
+            _F_TABLE[jmoo, i, jj[-1], jm, jmo, kk]
             * L(kk, h, i_, i, jj_, jj)
-            * F(jmoo, i_, jj_[-1], jm).T.conjugate()[kk, jmo_]
+            * _F_DAG_TABLE[jmoo, i_, jj_[-1], jm, kk, jmo_]
         )
 
     return component
 
 
+@lru_cache(maxsize=None)
+def _sigma_amplitude(index, state_f, state_i):
+    """Memoized wrapper around sigma() keyed by hashable qudit tuples.
+
+    The same qudit pairs recur across every (row, column) combination of
+    the operator matrix, so caching removes most repeated evaluations."""
+    return sigma(index, list(state_f), list(state_i))
+
+
+@lru_cache(maxsize=None)
+def _s_amplitude(jm, jmo, jmoo, jmo_, h, i_, i, jj_, jj):
+    """Memoized wrapper around S() keyed by hashable qudit tuples."""
+    return S(jm, jmo, jmoo, jmo_, h, i_, i, list(jj_), list(jj))
+
+
 def gen_sigma(index, state_i, state_f):
     qudit_len = len(state_i["qudits"][0])
     nb_anyons_per_qudit = qudit_len + 1
@@ -213,24 +240,28 @@ def gen_sigma(index, state_i, state_f):
 
         m = index // nb_anyons_per_qudit
         idx = index % nb_anyons_per_qudit
-        amplitude = sigma(idx, state_f["qudits"][m], state_i["qudits"][m])
-
-        for i, qudit in enumerate(state_i["qudits"]):
-            if i == m:
-                continue
-            elif qudit != state_f["qudits"][i]:
-                braket = 0
+        amplitude = _sigma_amplitude(
+            idx, tuple(state_f["qudits"][m]), tuple(state_i["qudits"][m])
+        )
 
-        for i, root in enumerate(state_i["roots"]):
-            if root != state_f["roots"][i]:
-                braket = 0
+        # Everything outside qudit m must match; whole-list comparisons
+        # run in C instead of walking the labels one by one.
+        if (
+            state_i["qudits"][:m] != state_f["qudits"][:m]
+            or state_i["qudits"][m + 1 :] != state_f["qudits"][m + 1 :]
+            or state_i["roots"] != state_f["roots"]
+        ):
+            braket = 0
 
     else:
         m = (index // nb_anyons_per_qudit) - 1
 
-        new_state_i = deepcopy(state_i)
-        new_state_i["qudits"][m][-1] = deepcopy(state_f["qudits"][m][-1])
-        new_state_i["qudits"][m + 1] = deepcopy(state_f["qudits"][m + 1])
+        new_state_i = {
+            "qudits": [qudit[:] for qudit in state_i["qudits"]],
+            "roots": state_i["roots"][:],
+        }
+        new_state_i["qudits"][m][-1] = state_f["qudits"][m][-1]
+        new_state_i["qudits"][m + 1] = state_f["qudits"][m + 1][:]
         """
             jm: int: j_m
             jmo: int: j_{m-1}
@@ -245,8 +276,8 @@ def gen_sigma(index, state_i, state_f):
         if m + 1 > 2:
             new_state_i["roots"][m - 1] = state_f["roots"][m - 1]
 
-            jj_ = deepcopy(new_state_i["qudits"][m + 1])
-            jj = deepcopy(state_i["qudits"][m + 1])
+            jj_ = new_state_i["qudits"][m + 1][:]
+            jj = state_i["qudits"][m + 1][:]
             h = state_i["qudits"][m][-2]
             i = state_i["qudits"][m][-1]
             i_ = new_state_i["qudits"][m][-1]
@@ -259,8 +290,8 @@ def gen_sigma(index, state_i, state_f):
         elif m + 1 == 2:
             new_state_i["roots"][m - 1] = state_f["roots"][m - 1]
 
-            jj_ = deepcopy(new_state_i["qudits"][m + 1])
-            jj = deepcopy(state_i["qudits"][m + 1])
+            jj_ = new_state_i["qudits"][m + 1][:]
+            jj = state_i["qudits"][m + 1][:]
             h = state_i["qudits"][m][-2]
             i = state_i["qudits"][m][-1]
             i_ = new_state_i["qudits"][m][-1]
@@ -272,8 +303,8 @@ def gen_sigma(index, state_i, state_f):
 
         elif m + 1 == 1:
 
-            jj_ = deepcopy(new_state_i["qudits"][m + 1])
-            jj = deepcopy(state_i["qudits"][m + 1])
+            jj_ = new_state_i["qudits"][m + 1][:]
+            jj = state_i["qudits"][m + 1][:]
             h = state_i["qudits"][m][-2]
             i = state_i["qudits"][m][-1]
             i_ = new_state_i["qudits"][m][-1]
@@ -283,13 +314,14 @@ def gen_sigma(index, state_i, state_f):
             jmo = state_i["qudits"][0][-1]
             jm = state_i["roots"][m]
 
-        amplitude += S(jm, jmo, jmoo, jmo_, h, i_, i, jj_, jj)
+        amplitude += _s_amplitude(jm, jmo, jmoo, jmo_, h, i_, i, tuple(jj_), tuple(jj))
         if new_state_i != state_f:
             braket = 0
 
     return braket * amplitude
 
 
+@lru_cache(maxsize=None)
 def generate_braiding_operator(index: int, nb_qudits: int, nb_anyons_per_qudit: int):
     """Generates the braiding operator of index 'index' for a system of
     a given number of qudits and anyons per qudit.
@@ -306,16 +338,51 @@ def generate_braiding_operator(index: int, nb_qudits: int, nb_anyons_per_qudit:
 
     Returns
     -------
-    List
+    ndarray
         Matrix representation of the braiding operator.
 
     """
-    basis = generate_basis(nb_qudits, nb_anyons_per_qudit)
-
-    sigmas = []
-    for f, base_f in enumerate(basis):
-        sigmas.append([])
-        for base_i in basis:
-            sigmas[f].append(gen_sigma(index, base_i, base_f))
-
+    basis = _generate_basis(nb_qudits, nb_anyons_per_qudit)
+    dim = len(basis)
+    qudit_len = nb_anyons_per_qudit - 1
+    sigmas = np.zeros((dim, dim), dtype=np.complex128)
+
+    # Each state's labels packed into one int8 row: the qudit labels
+    # flattened in order, followed by the fusion roots.
+    labels = np.array(
+        [
+            [label for qudit in state["qudits"] for label in qudit] + state["roots"]
+            for state in basis
+        ],
+        dtype=np.int8,
+    )
+
+    # The operator only mixes basis states that agree on every label the
+    # braid cannot touch: an internal braid acts inside qudit m, a
+    # boundary braid can also change the last label of qudit m, all of
+    # qudit m+1 and the fusion root between them. Grouping the basis by
+    # the frozen "spectator" columns restricts the quadratic gen_sigma
+    # sweep to the small blocks where amplitudes can be non-zero.
+    spectator = np.ones(labels.shape[1], dtype=bool)
+    if index % nb_anyons_per_qudit > 0:
+        m = index // nb_anyons_per_qudit
+        spectator[m * qudit_len : (m + 1) * qudit_len] = False
+    else:
+        m = index // nb_anyons_per_qudit - 1
+        spectator[(m + 1) * qudit_len - 1 : (m + 2) * qudit_len] = False
+        if m >= 1:
+            spectator[nb_qudits * qudit_len + m - 1] = False
+
+    spectator_labels = np.ascontiguousarray(labels[:, spectator])
+    groups = {}
+    for f in range(dim):
+        groups.setdefault(spectator_labels[f].tobytes(), []).append(f)
+
+    for members in groups.values():
+        for f in members:
+            for i in members:
+                sigmas[f, i] = gen_sigma(index, basis[i], basis[f])
+
+    # The matrix is shared between repeat callers via the cache.
+    sigmas.flags.writeable = False
     return sigmas
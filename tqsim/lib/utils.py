@@ -23,10 +23,10 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-import matplotlib.pyplot as plt
-import matplotlib as mpl
-from math import pi, cos, exp, atan
+from functools import lru_cache
+from math import pi
 
+import numpy as np
 
 MATPLOTLIB_INLINE_BACKENDS = {
     "module://ipykernel.pylab.backend_inline",
@@ -47,7 +47,7 @@ def matplotlib_close_if_inline(figure):
         matplotlib.pyplot.close(figure)
 
 
-def cplot(cmatrix, sigma=0.5, title=''):
+def cplot(cmatrix, sigma=0.5, title="", show_legend=True, return_data=False):
     """Plots a complex-valued matrix with color coding, and a color map.
     'Sigma' controls how much small values are colored. A lower value will
     emphasize small values more.
@@ -60,70 +60,92 @@ def cplot(cmatrix, sigma=0.5, title=''):
         Standard deviation squared. The default is 0.5.
     title : str, optional
         Title of the plotted figure. The default is ''.
+    show_legend : bool, optional
+        Whether to include the color-scale legend. The default is True.
+    return_data : bool, optional
+        If True, skip matplotlib entirely and return the raw RGBA
+        arrays instead of a figure. The default is False.
 
     Returns
     -------
-    None.
+    matplotlib.figure.Figure or tuple of ndarray
+        The rendered figure, or — when return_data is True — the tuple
+        (image, legend) of RGBA arrays, with legend None unless
+        show_legend is set.
 
     """
-    img = []
-    for r, row in enumerate(cmatrix):
-        img.append([])
-        for c in row:
-            y = c.imag
-            x = c.real
-
-            if x == 0:
-                if y > 0:
-                    theta = pi/2
-                else:
-                    theta = -pi/2
-            else:
-                theta = atan(y/x)
-            if x < 0:
-                theta += pi
-            rad = 1- exp(-(x**2 + y**2)/sigma)
-            img[-1].append([cos(theta/2)**2,
-                            cos(theta/2 + 2*pi/3)**2,
-                            cos(theta/2 - 2*pi/3)**2,
-                            rad])
-
-    mpl.rcParams['figure.figsize'] = (10, 10)
-    fig, (pl, sc) = plt.subplots(nrows=1, ncols=2, sharex=False)
-                                 #figsize=[8, 25])
+    cmatrix = np.asarray(cmatrix)
+    img = _color_image(cmatrix.real, cmatrix.imag, sigma)
+
+    if return_data:
+        return img, scale(sigma=sigma) if show_legend else None
+
+    # Imported here so that importing tqsim does not pull in matplotlib.
+    # The Figure API is used directly instead of pyplot so that no global
+    # state (rcParams, the pyplot figure manager) is touched.
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 10))
+    if show_legend:
+        (pl, sc) = fig.subplots(nrows=1, ncols=2, sharex=False)
+        pl.imshow(scale(sigma=sigma), extent=(-1, 1, -1, 1))
+        pl.set_xlabel("Re")
+        pl.set_ylabel("Img")
+        pl.grid(True)
+    else:
+        sc = fig.subplots(nrows=1, ncols=1)
     sc.imshow(img)
-    pl.imshow(scale(sigma=sigma), extent=(-1, 1, -1, 1))
-    pl.set_xlabel('Re')
-    pl.set_ylabel('Img')
-    pl.grid(True)
-    plt.title(title)
-    plt.show()
-    return
+    sc.set_title(title)
+    matplotlib_close_if_inline(fig)
+    return fig
 
+
+@lru_cache(maxsize=16)
 def scale(sigma=0.5):
     """
     Plot the scaling spectrum of the complex plane [-1, 1, -i, i]
+
+    The image only depends on sigma, so it is computed once per value
+    and returned as a read-only array.
     """
-    img = []
     sc = 50
-    for r in range(sc, -sc, -1):
-        img.append([])
-        for c  in range(-sc, sc, 1):
-            y = (r/sc)
-            x = (c/sc)
-            if x == 0:
-                if y > 0:
-                    theta = pi/2
-                else:
-                    theta = -pi/2
-            else:
-                theta = atan(y/x)
-            if x < 0:
-                theta += pi
-            rad = 1- exp(-(x**2 + y**2)/sigma)
-            img[-1].append([cos(theta/2)**2,
-                            cos(theta/2 + 2*pi/3)**2,
-                            cos(theta/2 - 2*pi/3)**2,
-                            rad])
+    y = np.arange(sc, -sc, -1)[:, None] / sc
+    x = np.arange(-sc, sc)[None, :] / sc
+    y, x = np.broadcast_arrays(y, x)
 
+    img = _color_image(x, y, sigma)
+    img.flags.writeable = False
     return img
+
+
+def _color_image(x, y, sigma):
+    """Maps arrays of real and imaginary parts to an RGBA image, coloring
+    the phase and shading the magnitude.
+
+    The image only feeds imshow, which quantizes to 8 bits per channel,
+    so everything is computed in single precision."""
+    x = np.asarray(x, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+    sigma = np.float32(sigma)
+
+    theta = np.arctan2(y, x)
+
+    rad = 1 - np.exp(-(x**2 + y**2) / sigma)
+
+    # The hue channels are cos(theta/2 + k*2*pi/3)**2 for k = 0, -1, 1.
+    # With the half-angle identity cos(a)**2 = (1 + cos(2a))/2 and the
+    # addition formula, all three reduce to one cos/sin pair per pixel.
+    c = np.cos(theta)
+    s = np.sin(theta)
+    half_c = np.float32(0.5) * c
+    half_s = np.float32(np.sqrt(3) / 2) * s
+
+    return np.stack(
+        [
+            0.5 + half_c,
+            0.5 - 0.5 * half_c + 0.5 * half_s,
+            0.5 - 0.5 * half_c - 0.5 * half_s,
+            rad,
+        ],
+        axis=-1,
+    )